@@ -1,8 +1,13 @@
 # app.py
 import streamlit as st
 import pandas as pd
+import numpy as np
+from pandas.api.types import union_categoricals
 import sqlite3
+import threading
+import io
 from datetime import datetime
+from collections import namedtuple
 import pytz
 import smtplib
 from email.mime.text import MIMEText
@@ -203,21 +208,97 @@ st.set_page_config(
     layout="wide"
 )
 
-# Load data (cached so it's fast)
-@st.cache_data
+# Shared database connection (cached so it's reused across reruns and sessions)
+@st.cache_resource
+def get_conn():
+    conn = sqlite3.connect('wusa_schedule.db', check_same_thread=False)
+    # WAL lets readers continue during writes; mmap and a 64 MB page cache keep reads in memory
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+# Lock held around every write on the shared connection - sessions run on separate
+# threads but share its transaction, so one session's commit or rollback must not
+# land in the middle of another session's write
+@st.cache_resource
+def get_write_lock():
+    return threading.Lock()
+
+# Columns read into the cached games frame (the audit trail columns are only
+# ever read straight from the database, so they are left out)
+GAMES_COLUMNS = [
+    'Game #', 'Game Date', 'Field', 'Time', 'Home', 'Away', 'Week', 'Daycode',
+    'Division', 'Game', 'Div', 'Status', 'Comment', 'Original Date'
+]
+
+# Column types applied when loading the games table (category levels come out
+# sorted, so .cat.categories doubles as the sorted list of distinct values) - numeric
+# columns are left to the downcast in load_games, which also copes with missing values
+GAMES_DTYPES = {
+    'Game Date': 'category',
+    'Division': 'category',
+    'Field': 'category',
+    'Home': 'category',
+    'Away': 'category',
+    'Time': 'category',
+    'Status': 'category'
+}
+
+# Load data (cached as a shared resource so reruns reuse one frame instead of
+# unpickling a fresh copy each time - every session's thread reads it, so it is
+# never modified; writes clear this cache and the next rerun loads a new frame)
+@st.cache_resource
 def load_games():
-    conn = sqlite3.connect('wusa_schedule.db')
-    df = pd.read_sql("SELECT * FROM games", conn)
-    conn.close()
-    # Convert Game Date to datetime for filtering
-    df['Game Date Parsed'] = pd.to_datetime(df['Game Date'])
+    conn = get_conn()
+    # Store repeated text values as categories so filters and groupbys compare integer codes
+    columns = ', '.join(f'"{col}"' for col in GAMES_COLUMNS)
+    df = pd.read_sql_query(f"SELECT {columns} FROM games", conn, dtype=GAMES_DTYPES)
+    # Downcast the remaining numeric columns to the smallest type that holds their values
+    for col in df.select_dtypes('integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes('float').columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    # Convert Game Date to datetime for filtering (parsing each distinct date once)
+    parsed_dates = pd.to_datetime(df['Game Date'].cat.categories)
+    df['Game Date Parsed'] = parsed_dates.take(df['Game Date'].cat.codes, allow_fill=True, fill_value=pd.NaT)
+    bump_data_version()
     return df
 
+# Shared version counter for the cached games frame - bumped whenever the frame is
+# loaded, so results built from it know to rebuild
+@st.cache_resource
+def get_data_version():
+    return {'games': 0}
+
+def games_cache_key(frame):
+    """Cache key for the shared games frame: its identity plus the data version"""
+    return (id(frame), get_data_version()['games'])
+
+# Cached helpers that take the shared games frame (rebuilt on every rerun, so the
+# list always holds the current script run's helpers)
+GAMES_CACHES = []
+
+def cache_games(func):
+    """Cache a helper that takes the shared games frame, keyed on the data version instead of hashing every cell"""
+    # Enough entries for one per game date; older versions are cleared by bump_data_version
+    cached = st.cache_data(func, max_entries=64, hash_funcs={pd.DataFrame: games_cache_key})
+    GAMES_CACHES.append(cached)
+    return cached
+
+def bump_data_version():
+    """Mark the games frame as changed and drop the cached results built from older versions"""
+    get_data_version()['games'] += 1
+    for cached in GAMES_CACHES:
+        cached.clear()
+
 # Database migration - add audit trail column if it doesn't exist
 def ensure_audit_trail_column():
     """Ensure the game_audit_trail and last_updated columns exist in the database"""
     try:
-        conn = sqlite3.connect('wusa_schedule.db')
+        conn = get_conn()
         cursor = conn.cursor()
         
         # Check if columns exist
@@ -238,7 +319,6 @@ def ensure_audit_trail_column():
         cursor.execute("DROP TABLE IF EXISTS schedule_requests")
         conn.commit()
         
-        conn.close()
     except Exception as e:
         print(f"Error ensuring audit trail columns: {e}")
 
@@ -246,7 +326,7 @@ def ensure_audit_trail_column():
 def ensure_settings_table():
     """Ensure the settings table exists in the database"""
     try:
-        conn = sqlite3.connect('wusa_schedule.db')
+        conn = get_conn()
         cursor = conn.cursor()
 
         # Create settings table if it doesn't exist
@@ -271,7 +351,6 @@ def ensure_settings_table():
             cursor.execute("INSERT INTO settings (key, value) VALUES ('admin_password', 'wusarocks')")
 
         conn.commit()
-        conn.close()
     except Exception as e:
         print(f"Error ensuring settings table: {e}")
 
@@ -279,35 +358,70 @@ def ensure_settings_table():
 def get_setting(key, default=''):
     """Get a setting value from the database"""
     try:
-        conn = sqlite3.connect('wusa_schedule.db')
+        conn = get_conn()
         cursor = conn.cursor()
         cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
         result = cursor.fetchone()
-        conn.close()
         return result[0] if result else default
     except Exception as e:
         print(f"Error getting setting {key}: {e}")
         return default
 
-def set_setting(key, value):
-    """Set a setting value in the database"""
+def set_settings(settings):
+    """Set several setting values in the database in one transaction"""
+    try:
+        conn = get_conn()
+        with get_write_lock(), conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO settings (key, value)
+                VALUES (?, ?)
+            """, settings.items())
+        return True
+    except Exception as e:
+        print(f"Error setting {', '.join(settings)}: {e}")
+        return False
+
+# Database migration - create indexes used by lookups and updates
+def ensure_indexes():
+    """Ensure the games table indexes exist in the database"""
     try:
-        conn = sqlite3.connect('wusa_schedule.db')
+        conn = get_conn()
         cursor = conn.cursor()
+
+        # Game # is the key for every comment and Edit Game update
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_games_game_num ON games("Game #")')
+
+        # Partial index over edited games only, already in Recent Changes order
         cursor.execute("""
-            INSERT OR REPLACE INTO settings (key, value)
-            VALUES (?, ?)
-        """, (key, value))
+            CREATE INDEX IF NOT EXISTS idx_games_edited
+            ON games(last_updated DESC)
+            WHERE game_audit_trail != ''
+        """)
+
         conn.commit()
-        conn.close()
-        return True
     except Exception as e:
-        print(f"Error setting {key}: {e}")
-        return False
+        print(f"Error ensuring indexes: {e}")
 
-# Run migrations on app startup
-ensure_audit_trail_column()
-ensure_settings_table()
+# Run migrations once per server process rather than on every rerun
+@st.cache_resource
+def ensure_schema():
+    ensure_audit_trail_column()
+    ensure_settings_table()
+    ensure_indexes()
+    return True
+
+def audit_columns_exist():
+    """Check that the audit trail columns are still on the games table"""
+    columns = {column[1] for column in get_conn().execute("PRAGMA table_info(games)")}
+    return {'game_audit_trail', 'last_updated'} <= columns
+
+ensure_schema()
+
+# Reloading the schedule (load_data.py replaces the games table) drops the audit
+# columns and indexes, so rerun the migrations when the cheap column check fails
+if not audit_columns_exist():
+    ensure_schema.clear()
+    ensure_schema()
 
 # Helper function to add audit trail entry
 def add_audit_entry(game_number, field_name, old_value, new_value):
@@ -330,14 +444,17 @@ def add_audit_entry(game_number, field_name, old_value, new_value):
     return json.dumps(entry)
 
 # Helper function to sort divisions numerically (7U, 8U, 9U, 10U, 12U, 14U)
-def sort_divisions(divisions):
-    def get_numeric_value(div):
-        try:
-            # Extract numeric part from division (e.g., "10U" -> 10)
-            return int(''.join(filter(str.isdigit, str(div))))
-        except:
-            return 999  # Put non-numeric divisions at the end
-    return sorted(divisions, key=get_numeric_value)
+@cache_games
+def get_division_numbers(df):
+    """Get a dictionary mapping each division to its number (e.g., "10U" -> 10)"""
+    divisions = df['Division'].cat.categories
+    # Keep only the digits of every division name in one vectorized pass
+    numbers = pd.to_numeric(divisions.str.replace(r'\D', '', regex=True), errors='coerce')
+    # Put non-numeric divisions at the end
+    return dict(zip(divisions, numbers.fillna(999).astype(int).tolist()))
+
+def sort_divisions(divisions, division_numbers):
+    return sorted(divisions, key=division_numbers.get)
 
 # Helper function to calculate Week and Daycode from Game Date
 def calculate_week_and_daycode(game_date_str):
@@ -361,7 +478,316 @@ def calculate_week_and_daycode(game_date_str):
         # If parsing fails, return defaults
         return 0, 0
 
+# Cached lookups so dropdown options aren't rebuilt on every rerun
+FilterOptions = namedtuple('FilterOptions', ['divisions', 'weeks', 'fields', 'statuses', 'times', 'dates', 'home_teams', 'away_teams', 'min_date', 'max_date'])
+
+@cache_games
+def get_filter_options(df):
+    """Get the sorted Division, Week, Field, Status, Time, Game Date, Home, and Away options plus the season date range"""
+    return FilterOptions(
+        divisions=sort_divisions(df['Division'].unique(), get_division_numbers(df)),
+        weeks=sorted(df['Week'].unique()),
+        fields=list(df['Field'].cat.categories),
+        statuses=list(df['Status'].cat.categories),
+        times=list(df['Time'].cat.categories),
+        dates=list(df['Game Date'].cat.categories),
+        home_teams=list(df['Home'].cat.categories),
+        away_teams=list(df['Away'].cat.categories),
+        min_date=df['Game Date Parsed'].min().date(),
+        max_date=df['Game Date Parsed'].max().date()
+    )
+
+@cache_games
+def get_schedule_dates(df):
+    """Get each distinct Game Date with its parsed date, in chronological order"""
+    return df[['Game Date', 'Game Date Parsed']].drop_duplicates().sort_values('Game Date Parsed')
+
+@cache_games
+def get_all_teams(df):
+    """Get the sorted list of all teams playing either Home or Away"""
+    # Union the category arrays (unused categories dropped first for filtered frames)
+    teams = union_categoricals([
+        df['Home'].cat.remove_unused_categories(),
+        df['Away'].cat.remove_unused_categories()
+    ], sort_categories=True)
+    return list(teams.categories)
+
+def get_division_teams(df, division):
+    """Get the sorted list of teams playing in a division"""
+    return get_teams_by_division(df).get(division, [])
+
+@cache_games
+def get_teams_by_division(df):
+    """Get a dictionary mapping each division to its sorted list of teams, from one groupby"""
+    division_teams = team_appearances(df)[['Division', 'Team']].drop_duplicates()
+    return {division: sorted(teams) for division, teams in division_teams.groupby('Division', observed=True)['Team']}
+
+# Group row positions rather than frame copies, so a cache hit only unpickles
+# small integer arrays - slice with df.iloc[...] at the call site
+@cache_games
+def division_rows(df):
+    """Get a dictionary mapping each division to the row positions of its games"""
+    return df.groupby('Division', observed=True).indices
+
+@cache_games
+def date_rows(df):
+    """Get a dictionary mapping each Game Date to the row positions of its games"""
+    return df.groupby('Game Date', observed=True).indices
+
+@cache_games
+def day_rows(df):
+    """Get a dictionary mapping each parsed game day to the row positions of its games"""
+    return df.groupby(df['Game Date Parsed'].dt.date).indices
+
+@cache_games
+def team_appearances(df):
+    """Get one row per team per game, with Home and Away melted into a single Team column"""
+    return df.melt(
+        id_vars=['Division', 'Week', 'Game Date'],
+        value_vars=['Home', 'Away'],
+        value_name='Team'
+    ).dropna(subset=['Team'])
+
+@cache_games
+def team_week_counts(df):
+    """Get the number of games each team plays per week, indexed by (Division, Team)"""
+    return (
+        team_appearances(df).groupby(['Division', 'Team', 'Week'], observed=True).size()
+        .unstack('Week', fill_value=0)
+    )
+
+@cache_games
+def get_team_index(df):
+    """
+    Get the sorted list of all teams plus dictionaries mapping each team
+    to the row positions of its Home games and of its Away games.
+    """
+    home_idx = df.groupby('Home', observed=True).indices
+    away_idx = df.groupby('Away', observed=True).indices
+    return get_all_teams(df), home_idx, away_idx
+
+def text_columns(frame):
+    """Convert every column to text for string concatenation, rendering missing values as 'None'"""
+    return frame.astype(object).where(frame.notna(), None).astype(str)
+
+def team_game_rows(home_idx, away_idx, teams):
+    """Get the sorted row positions of games where any of the teams plays Home or Away"""
+    no_games = np.empty(0, dtype=np.intp)
+    rows = [home_idx.get(team, no_games) for team in teams] + [away_idx.get(team, no_games) for team in teams]
+    return np.unique(np.concatenate([no_games] + rows))
+
+@cache_games
+def field_pivot(df, date):
+    """Get the Time x Field game counts for one date, with Grand Total row and column"""
+    date_df = df.iloc[date_rows(df)[date]]
+    all_fields = list(date_df['Field'].cat.remove_unused_categories().cat.categories)
+    all_times = list(date_df['Time'].cat.remove_unused_categories().cat.categories)
+    
+    # Count games per time slot per field in one reshape
+    pivot_df = (
+        date_df.groupby(['Time', 'Field'], observed=True).size()
+        .unstack('Field', fill_value=0)
+        .reindex(index=all_times, columns=all_fields, fill_value=0)
+        .rename_axis(index='Time', columns=None)
+        .reset_index()
+    )
+    
+    # Add Grand Total column (sum of games per time slot)
+    pivot_df['Grand Total'] = pivot_df[all_fields].sum(axis=1)
+    
+    # Add Grand Total row (sum of games per field)
+    totals_row = {'Time': 'Grand Total', **pivot_df[all_fields].sum().to_dict()}
+    totals_row['Grand Total'] = len(date_df)
+    pivot_df = pd.concat([pivot_df, pd.DataFrame([totals_row])], ignore_index=True)
+    
+    # Replace 0 with empty string for display (field totals are never zero)
+    pivot_df[all_fields] = pivot_df[all_fields].mask(pivot_df[all_fields].eq(0), '')
+    return pivot_df
+
+@cache_games
+def get_multi_division_fields(df):
+    """Get the (Game Date, Field) pairs where more than one division plays that day"""
+    division_counts = df.groupby(['Game Date', 'Field'], observed=True)['Division'].nunique()
+    return set(division_counts[division_counts > 1].index)
+
+@cache_games
+def master_field_rows(df, dates, fields):
+    """
+    Get one row per date and time slot listing the divisions on each field,
+    plus a dictionary mapping (date, time, field) to the games played there.
+    """
+    game_rows = date_rows(df)
+    master_data = []
+
+    # Group the shown games by slot once: (date, time, field) -> sorted divisions and game info
+    slot_keys = ['Game Date', 'Time', 'Field']
+    games = df[df['Game Date'].isin(dates)]
+    slot_divisions = (
+        games[slot_keys + ['Division']].drop_duplicates().sort_values('Division')
+        .groupby(slot_keys, observed=True, sort=False)['Division'].agg(', '.join).to_dict()
+    )
+    game_text = text_columns(games[['Division', 'Home', 'Away']])
+    game_info = game_text['Division'] + " - " + game_text['Home'] + " vs " + game_text['Away']
+    game_details_master = game_info.groupby([games[key] for key in slot_keys], observed=True, sort=False).agg(list).to_dict()
+
+    for selected_date in dates:
+        date_df = df.iloc[game_rows[selected_date]]
+
+        if len(date_df) == 0:
+            continue
+
+        # Format as "Sun-Sep 14" (day without leading zero)
+        short_date = date_df['Game Date Parsed'].iloc[0].strftime('%a-%b %d').replace(' 0', ' ')
+
+        # Get unique time slots for this date
+        date_times = list(date_df['Time'].cat.remove_unused_categories().cat.categories)
+
+        for time_slot in date_times:
+            row_data = {
+                'Date': short_date,  # Use short formatted date
+                'Date_Full': selected_date,  # Keep full date for lookups
+                'Time': time_slot
+            }
+
+            # Get division names for each field at this date/time
+            for field in fields:
+                row_data[field] = slot_divisions.get((selected_date, time_slot, field), '')
+
+            # Calculate row total (count of games across all fields)
+            row_data['Grand Total'] = sum(1 for field in fields if row_data[field] != '')
+
+            master_data.append(row_data)
+
+    return master_data, game_details_master
+
+@cache_games
+def division_week_summary(df, division):
+    """Get a division's games per team per week, with Grand Total column and division total row"""
+    # Games per team per week (counted once for all divisions and cached)
+    week_counts = (
+        team_week_counts(df).loc[division]
+        .reindex(index=get_division_teams(df, division), columns=get_filter_options(df).weeks, fill_value=0)
+    )
+    
+    # Team rows show blanks for weeks without games
+    summary_df = week_counts.mask(week_counts.eq(0), '')
+    summary_df['Grand Total'] = week_counts.sum(axis=1)
+    
+    # Add division total row (sum of the team counts per week)
+    summary_df.loc[f'{division} Total'] = list(week_counts.sum()) + [week_counts.to_numpy().sum()]
+    
+    summary_df.columns = [f'Week {col}' if col != 'Grand Total' else col for col in summary_df.columns]
+    return summary_df.rename_axis('Team').reset_index()
+
+def team_date_counts(games, teams, dates):
+    """Count each team's games (Home or Away) on each date as a teams x dates matrix"""
+    # Factorize against the given teams/dates and count the flattened cell codes in one pass
+    team_codes = pd.Index(teams).get_indexer(pd.concat([games['Home'], games['Away']]).to_numpy(object))
+    date_codes = np.tile(pd.Index(dates).get_indexer(games['Game Date'].to_numpy(object)), 2)
+    keep = (team_codes >= 0) & (date_codes >= 0)
+    counts = np.bincount(
+        team_codes[keep] * len(dates) + date_codes[keep], minlength=len(teams) * len(dates)
+    ).reshape(len(teams), len(dates))
+    return pd.DataFrame(counts, index=pd.Index(teams, name='Team'), columns=pd.Index(dates, name='Game Date'))
+
+@cache_games
+def teams_by_day_matrix(df, division):
+    """Get a division's games per team per date, with multi-game day count and Grand Total columns"""
+    div_df = df.iloc[division_rows(df)[division]]
+    
+    # Get all unique dates sorted
+    all_dates = list(div_df['Game Date'].cat.remove_unused_categories().cat.categories)
+    
+    # Create date format mapping (Mon-11/3, Tue-12/1, etc.), formatting all dates in one call
+    date_headers = dict(zip(all_dates, pd.to_datetime(pd.Index(all_dates)).strftime('%a-%-m/%-d')))
+    
+    # Count games per team per date in a single pass over the Home/Away codes
+    date_counts = team_date_counts(div_df, get_division_teams(df, division), all_dates)
+    
+    # Build the display matrix, leaving cells blank where there is nothing to show
+    matrix_df = date_counts.mask(date_counts.eq(0), '')
+    dates_with_multiple_games = date_counts.gt(1).sum(axis=1)
+    matrix_df['Dates with >1 Game'] = dates_with_multiple_games.mask(dates_with_multiple_games.eq(0), '')
+    matrix_df['Grand Total'] = date_counts.sum(axis=1)
+    return matrix_df.rename(columns=date_headers).rename_axis(index='Team', columns=None).reset_index()
+
+@cache_games
+def get_team_divisions(df):
+    """Map each team to the Division of the first game it appears in"""
+    # Interleave Home and Away per row so the first appearance wins in row order
+    teams = np.column_stack([df['Home'].to_numpy(object), df['Away'].to_numpy(object)]).ravel()
+    divisions = pd.Series(np.repeat(df['Division'].to_numpy(object), 2), index=teams)
+    return divisions[divisions.index.notna() & ~divisions.index.duplicated()].to_dict()
+
+@cache_games
+def get_team_options(df):
+    """
+    Get a dictionary mapping "Division - Team" labels to team names, ordered by
+    division number and then team name, for the team selectors.
+    """
+    team_division_map = get_team_divisions(df)
+    division_numbers = get_division_numbers(df)
+    teams = sorted(team_division_map, key=lambda team: (division_numbers[team_division_map[team]], team))
+    return {f"{team_division_map[team]} - {team}": team for team in teams}
+
+@cache_games
+def get_game_start_times(df):
+    """Get each game's start as a CST-aware timestamp (NaT where the date/time can't be parsed)"""
+    # Combine game date and time, parse as naive datetimes, then localize to CST
+    game_datetimes = pd.to_datetime(
+        df['Game Date'].astype(str) + ' ' + df['Time'].astype(str),
+        format='%A, %B %d, %Y %I:%M %p',
+        errors='coerce'
+    )
+    return game_datetimes.dt.tz_localize('America/Chicago', ambiguous=False, nonexistent='shift_forward')
+
+@cache_games
+def get_game_labels(df):
+    """Get the Edit Game dropdown label for every game, indexed like df"""
+    # Vectorized string concatenation
+    game_text = text_columns(df[['Game #', 'Game Date', 'Time', 'Division', 'Home', 'Away', 'Field']])
+    return (
+        "Game #" + game_text['Game #'] + " | " + game_text['Game Date'] + " " + game_text['Time'] +
+        " | " + game_text['Division'] + " | " + game_text['Home'] + " vs " + game_text['Away'] +
+        " @ " + game_text['Field']
+    )
+
+# Edit Game saves clear this, so the TTL only bounds staleness from outside writes
+@st.cache_data(ttl=30)
+def load_edited_games():
+    """Load the games that have an audit trail, most recently updated first"""
+    conn = get_conn()
+    # Only the columns Recent Changes uses; served by idx_games_edited
+    return pd.read_sql_query("""
+        SELECT "Division", "Game Date", "Time", "Home", "Away", game_audit_trail
+        FROM games 
+        WHERE game_audit_trail IS NOT NULL AND game_audit_trail != ''
+        ORDER BY last_updated DESC
+    """, conn)
+
+# A handful of entries covers the download buttons on screen; older filter results are evicted
+@st.cache_data(max_entries=16)
+def to_csv_bytes(df, index=False):
+    """Encode a DataFrame as CSV bytes for download buttons"""
+    # Write straight into a bytes buffer rather than building a str and encoding a copy
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=index, encoding='utf-8')
+    return buffer.getvalue()
+
+# Most rows sent to the browser for one table; longer tables are paged
+MAX_TABLE_ROWS = 500
+
+def show_dataframe(df, **kwargs):
+    """Show a DataFrame with st.dataframe, paging through it with a slider when it is long"""
+    if len(df) > MAX_TABLE_ROWS:
+        last_start = (len(df) - 1) // MAX_TABLE_ROWS * MAX_TABLE_ROWS
+        start = st.slider("Start row", 0, last_start, 0, step=MAX_TABLE_ROWS)
+        st.markdown(f"*Rows {start + 1}-{min(start + MAX_TABLE_ROWS, len(df))} of {len(df)}*")
+        df = df.iloc[start:start + MAX_TABLE_ROWS]
+    st.dataframe(df, **kwargs)
+
 df = load_games()
+filter_options = get_filter_options(df)
 
 # Sidebar
 # Add logo at the top
@@ -407,21 +833,9 @@ import pytz
 cst = pytz.timezone('America/Chicago')
 now_cst = datetime.now(cst)
 
-# Count games with date/time in the future
-games_remaining = 0
-for _, game in df.iterrows():
-    try:
-        # Combine game date and time
-        game_datetime_str = f"{game['Game Date']} {game['Time']}"
-        # Parse as naive datetime, then localize to CST
-        game_datetime = pd.to_datetime(game_datetime_str, format='%A, %B %d, %Y %I:%M %p')
-        game_datetime_cst = cst.localize(game_datetime)
-        
-        if game_datetime_cst > now_cst:
-            games_remaining += 1
-    except:
-        # If parsing fails, assume game is in the future
-        games_remaining += 1
+# Count games with date/time in the future (games whose start can't be parsed count as future)
+game_starts = get_game_start_times(df)
+games_remaining = int((game_starts.isna() | (game_starts > now_cst)).sum())
 
 # Display metrics
 st.sidebar.info(f"**Total Games:** {total_games}")
@@ -471,8 +885,8 @@ if page == "📅 Full Schedule":
     st.title("📅 Full Schedule")
 
     # Get min and max dates from the schedule
-    min_date = df['Game Date Parsed'].min().date()
-    max_date = df['Game Date Parsed'].max().date()
+    min_date = filter_options.min_date
+    max_date = filter_options.max_date
 
     # Initialize session state for filters if they don't exist (all empty on first load)
     if 'filter_divisions' not in st.session_state:
@@ -510,19 +924,19 @@ if page == "📅 Full Schedule":
     with col1:
         selected_divisions = st.multiselect(
             "Division",
-            sort_divisions(df['Division'].unique()),
+            filter_options.divisions,
             key='filter_divisions'
         )
     with col2:
         selected_weeks = st.multiselect(
             "Week",
-            sorted(df['Week'].unique()),
+            filter_options.weeks,
             key='filter_weeks'
         )
     with col3:
         selected_fields = st.multiselect(
             "Field",
-            sorted(df['Field'].unique()),
+            filter_options.fields,
             key='filter_fields'
         )
 
@@ -530,9 +944,7 @@ if page == "📅 Full Schedule":
     col4, col5, col6 = st.columns(3)
     with col4:
         # Get all unique teams (both home and away), filtering out NaN values
-        home_teams = df['Home'].dropna().unique()
-        away_teams = df['Away'].dropna().unique()
-        all_teams = sorted(set(list(home_teams) + list(away_teams)))
+        all_teams, home_idx, away_idx = get_team_index(df)
 
         selected_teams = st.multiselect(
             "Team (Home or Away)",
@@ -559,7 +971,7 @@ if page == "📅 Full Schedule":
     with col7:
         selected_status = st.multiselect(
             "Status",
-            sorted(df['Status'].unique()),
+            filter_options.statuses,
             key='filter_status'
         )
     with col8:
@@ -569,40 +981,55 @@ if page == "📅 Full Schedule":
             placeholder="Search comments..."
         )
 
-    # Filter data - only apply filters if values are selected
-    filtered_df = df.copy()
-
-    if selected_divisions:
-        filtered_df = filtered_df[filtered_df['Division'].isin(selected_divisions)]
-
-    if selected_weeks:
-        filtered_df = filtered_df[filtered_df['Week'].isin(selected_weeks)]
-
-    if selected_fields:
-        filtered_df = filtered_df[filtered_df['Field'].isin(selected_fields)]
-
-    if selected_teams:
-        # Filter to games where the selected team is either home or away
-        filtered_df = filtered_df[
-            filtered_df['Home'].isin(selected_teams) |
-            filtered_df['Away'].isin(selected_teams)
-        ]
-
-    if selected_status:
-        filtered_df = filtered_df[filtered_df['Status'].isin(selected_status)]
+    # Only rebuild the filtered frame when a filter (or the loaded data) changed,
+    # so edits in the schedule editor don't rescan every column
+    filter_key = (
+        tuple(selected_divisions), tuple(selected_weeks), tuple(selected_fields),
+        tuple(selected_teams), tuple(selected_status), comment_filter, start_date, end_date
+    )
+    if (st.session_state.get('schedule_filter_key') != filter_key
+            or st.session_state.get('schedule_filter_version') != get_data_version()['games']):
+        # Filter data - only apply filters that narrow the schedule (nothing selected,
+        # or every option selected, keeps all rows and skips the scan)
+        masks = []
+
+        if selected_divisions and len(set(selected_divisions)) < len(filter_options.divisions):
+            masks.append(df['Division'].isin(selected_divisions))
+
+        if selected_weeks and len(set(selected_weeks)) < len(filter_options.weeks):
+            masks.append(df['Week'].isin(selected_weeks))
+
+        if selected_fields and len(set(selected_fields)) < len(filter_options.fields):
+            masks.append(df['Field'].isin(selected_fields))
+
+        if selected_teams and len(set(selected_teams)) < len(all_teams):
+            # Filter to games where the selected team is either home or away
+            team_mask = np.zeros(len(df), dtype=bool)
+            team_mask[team_game_rows(home_idx, away_idx, selected_teams)] = True
+            masks.append(team_mask)
+
+        if selected_status and len(set(selected_status)) < len(filter_options.statuses):
+            masks.append(df['Status'].isin(selected_status))
+
+        # Apply comment contains filter
+        if comment_filter:
+            # Filter for rows where Comment contains the search string (case-insensitive)
+            masks.append(df['Comment'].fillna('').str.contains(comment_filter, case=False, na=False))
+
+        # Apply date range filter when it is narrower than the whole season
+        # (compared as timestamps, so the parsed column is never converted to date objects)
+        if start_date > min_date or end_date < max_date:
+            masks.append(
+                (df['Game Date Parsed'] >= pd.Timestamp(start_date)) &
+                (df['Game Date Parsed'] < pd.Timestamp(end_date) + pd.Timedelta(days=1))
+            )
 
-    # Apply comment contains filter
-    if comment_filter:
-        # Filter for rows where Comment contains the search string (case-insensitive)
-        filtered_df = filtered_df[
-            filtered_df['Comment'].fillna('').str.contains(comment_filter, case=False, na=False)
-        ]
+        # Combine every filter into one mask so the frame is only sliced once
+        st.session_state.schedule_filtered_df = df[np.logical_and.reduce(masks)] if masks else df
+        st.session_state.schedule_filter_key = filter_key
+        st.session_state.schedule_filter_version = get_data_version()['games']
 
-    # Apply date range filter
-    filtered_df = filtered_df[
-        (filtered_df['Game Date Parsed'].dt.date >= start_date) &
-        (filtered_df['Game Date Parsed'].dt.date <= end_date)
-    ]
+    filtered_df = st.session_state.schedule_filtered_df
 
     # Drop the parsed date column and internal columns before displaying
     columns_to_drop = ['Game Date Parsed', 'Original Date', 'game_audit_trail', 'last_updated']
@@ -628,38 +1055,38 @@ if page == "📅 Full Schedule":
     
     st.markdown("💡 **Tip:** You can edit the Comment column directly - changes are saved automatically! Only those with access to this page can view these comments.")
     
-    # Check if any comments were edited
-    if not edited_df.equals(display_df):
+    # Check if any comments were edited (only the Comment column is editable)
+    changed_mask = edited_df['Comment'].fillna('').to_numpy() != display_df['Comment'].fillna('').to_numpy()
+    
+    if changed_mask.any():
         # Find rows where Comment changed
-        changed_rows = edited_df[edited_df['Comment'] != display_df['Comment']]
+        changed_rows = edited_df.loc[changed_mask, ['Comment', 'Game #']]
         
-        if len(changed_rows) > 0:
-            # Update database for each changed row
-            conn = sqlite3.connect('wusa_schedule.db')
-            cursor = conn.cursor()
-            
-            for idx, row in changed_rows.iterrows():
-                cursor.execute(
+        # Update all changed rows in one transaction
+        conn = get_conn()
+        with get_write_lock():
+            with conn:
+                conn.executemany(
                     'UPDATE games SET "Comment" = ? WHERE "Game #" = ?',
-                    (row['Comment'], row['Game #'])
+                    zip(changed_rows['Comment'].tolist(), changed_rows['Game #'].tolist())
                 )
             
-            conn.commit()
-            conn.close()
-            
-            # Clear cache to reload data
-            st.cache_data.clear()
-            
-            # Show success message
-            st.success(f"✅ Updated {len(changed_rows)} comment(s) automatically!")
-            
-            # Small delay to show message, then rerun
-            import time
-            time.sleep(1)
-            st.rerun()
+            # Drop the cached frame rather than patching it - other sessions may be reading
+            # it - so the rerun loads the new comments (and bumps the data version)
+            load_games.clear()
+        
+        # Store success message in session state and rerun right away
+        st.session_state.comment_success_message = f"✅ Updated {len(changed_rows)} comment(s) automatically!"
+        st.rerun()
+    
+    # Show success message if it exists from previous save
+    if 'comment_success_message' in st.session_state:
+        st.success(st.session_state.comment_success_message)
+        # Clear the message so it doesn't show again
+        del st.session_state.comment_success_message
     
     # Download button
-    csv = edited_df.to_csv(index=False)
+    csv = to_csv_bytes(edited_df)
     st.download_button(
         "📥 Download as CSV",
         csv,
@@ -672,67 +1099,31 @@ elif page == "🏟️ Games by Field":
 
     # Get unique dates from the schedule in chronological order
     # Sort by the parsed date column to get proper chronological order
-    date_df_sorted = df[['Game Date', 'Game Date Parsed']].drop_duplicates().sort_values('Game Date Parsed')
+    date_df_sorted = get_schedule_dates(df)
     unique_dates = date_df_sorted['Game Date'].tolist()
 
     # Date selector
     selected_date = st.selectbox("Date", unique_dates)
     
     # Filter games for selected date
-    date_df = df[df['Game Date'] == selected_date].copy()
+    date_df = df.iloc[date_rows(df)[selected_date]]
     
     if len(date_df) == 0:
         st.info("No games scheduled for this date.")
     else:
-        # Get all unique fields and time slots
-        all_fields = sorted(date_df['Field'].unique())
-        all_times = sorted(date_df['Time'].unique())
+        # Get all unique fields for this date
+        all_fields = list(date_df['Field'].cat.remove_unused_categories().cat.categories)
         
-        # Create pivot table: Time (rows) x Field (columns), counting games
-        pivot_data = []
+        # Time (rows) x Field (columns) game counts with totals, cached per date
+        pivot_df = field_pivot(df, selected_date)
         
-        for time in all_times:
-            row_data = {'Time': time}
-            
-            for field in all_fields:
-                # Count games at this time/field combination
-                game_count = len(date_df[(date_df['Time'] == time) & (date_df['Field'] == field)])
-                row_data[field] = game_count if game_count > 0 else 0
-            
-            pivot_data.append(row_data)
-        
-        # Convert to DataFrame
-        pivot_df = pd.DataFrame(pivot_data)
-        
-        # Add Grand Total column (sum of games per time slot)
-        # Sum all columns except 'Time'
-        numeric_cols = [col for col in pivot_df.columns if col != 'Time']
-        pivot_df['Grand Total'] = pivot_df[numeric_cols].sum(axis=1)
+        # Create game details dictionary for tooltips: (time, field) -> list of game info
+        game_text = text_columns(date_df[['Division', 'Home', 'Away']])
+        game_info = game_text['Division'] + " - " + game_text['Home'] + " vs " + game_text['Away']
+        game_details = game_info.groupby([date_df['Time'], date_df['Field']], observed=True, sort=False).agg(list).to_dict()
         
-        # Add Grand Total row (sum of games per field)
-        totals_row = {'Time': 'Grand Total'}
-        for field in all_fields:
-            totals_row[field] = len(date_df[date_df['Field'] == field])
-        totals_row['Grand Total'] = len(date_df)
-        
-        # Append totals row
-        pivot_df = pd.concat([pivot_df, pd.DataFrame([totals_row])], ignore_index=True)
-        
-        # Replace 0 with empty string for display (except Grand Total column and row)
-        for col in all_fields:
-            pivot_df.loc[pivot_df.index[:-1], col] = pivot_df.loc[pivot_df.index[:-1], col].replace(0, '')
-        
-        # Create game details dictionary for tooltips
-        game_details = {}
-        for _, game_row in date_df.iterrows():
-            key = (game_row['Time'], game_row['Field'])
-            if key not in game_details:
-                game_details[key] = []
-            game_info = f"{game_row['Division']} - {game_row['Home']} vs {game_row['Away']}"
-            game_details[key].append(game_info)
-        
-        # Generate HTML table with styling and tooltips
-        html = """
+        # Generate HTML table with styling and tooltips (pieces are collected and joined once)
+        html_parts = ["""
         <style>
             .field-pivot-table {
                 border-collapse: collapse;
@@ -816,28 +1207,28 @@ elif page == "🏟️ Games by Field":
             <thead>
                 <tr>
                     <th>Time</th>
-        """
+        """]
         
         # Add column headers
         for field in all_fields:
-            html += f"<th>{field}</th>"
-        html += "<th>Grand Total</th></tr></thead><tbody>"
+            html_parts.append(f"<th>{field}</th>")
+        html_parts.append("<th>Grand Total</th></tr></thead><tbody>")
         
         # Add data rows
-        for idx, row in pivot_df.iterrows():
+        for row in pivot_df.to_dict('records'):
             is_total_row = row['Time'] == 'Grand Total'
-            html += "<tr>"
+            html_parts.append("<tr>")
             
             # Time column
             cell_class = 'total-row' if is_total_row else ''
-            html += f'<th class="{cell_class}">{row["Time"]}</th>'
+            html_parts.append(f'<th class="{cell_class}">{row["Time"]}</th>')
             
             # Field columns
             for field in all_fields:
                 if is_total_row:
                     cell_class = 'total-row'
                     value = row[field] if row[field] != '' else ''
-                    html += f'<td class="{cell_class}">{value}</td>'
+                    html_parts.append(f'<td class="{cell_class}">{value}</td>')
                 else:
                     value = row[field] if row[field] != '' else ''
                     
@@ -846,27 +1237,27 @@ elif page == "🏟️ Games by Field":
                     if key in game_details and value != '':
                         # Create tooltip with game details
                         tooltip_content = "<br>".join([f'<div class="game-item">{game}</div>' for game in game_details[key]])
-                        html += f'''<td class="tooltip-cell">
+                        html_parts.append(f'''<td class="tooltip-cell">
                             {value}
                             <span class="tooltiptext">{tooltip_content}</span>
-                        </td>'''
+                        </td>''')
                     else:
-                        html += f'<td>{value}</td>'
+                        html_parts.append(f'<td>{value}</td>')
             
             # Grand Total column
             if is_total_row:
                 cell_class = 'total-cell'
             else:
                 cell_class = 'total-column'
-            html += f'<td class="{cell_class}">{row["Grand Total"]}</td>'
-            html += "</tr>"
+            html_parts.append(f'<td class="{cell_class}">{row["Grand Total"]}</td>')
+            html_parts.append("</tr>")
         
-        html += "</tbody></table>"
+        html_parts.append("</tbody></table>")
         
-        st.markdown(html, unsafe_allow_html=True)
+        st.markdown("".join(html_parts), unsafe_allow_html=True)
         
         # Download button
-        csv = pivot_df.to_csv(index=False)
+        csv = to_csv_bytes(pivot_df)
         st.download_button(
             "📥 Download as CSV",
             csv,
@@ -884,7 +1275,7 @@ elif page == "🏟️ Master Field View":
     highlight_multi_division = st.checkbox("Highlight When Two Different Divisions Play on the Same Field on the Same Day", value=False)
 
     # Get unique dates from the schedule in chronological order
-    date_df_sorted = df[['Game Date', 'Game Date Parsed']].drop_duplicates().sort_values('Game Date Parsed')
+    date_df_sorted = get_schedule_dates(df)
 
     # Filter out past dates if toggle is on
     if hide_past:
@@ -893,17 +1284,8 @@ elif page == "🏟️ Master Field View":
 
     unique_dates = date_df_sorted['Game Date'].tolist()
 
-    # Create a mapping of full dates to short formatted dates
-    date_format_map = {}
-    for _, row in date_df_sorted.iterrows():
-        full_date = row['Game Date']
-        parsed_date = row['Game Date Parsed']
-        # Format as "Sun-Sep 14" (day without leading zero)
-        short_date = parsed_date.strftime('%a-%b %d').replace(' 0', ' ')
-        date_format_map[full_date] = short_date
-
     # Get all unique fields across the entire season
-    all_fields = sorted(df['Field'].unique())
+    all_fields = list(filter_options.fields)
     # Add McGovern and Pershing even if they have no games
     if 'McGovern' not in all_fields:
         all_fields.append('McGovern')
@@ -914,72 +1296,23 @@ elif page == "🏟️ Master Field View":
     # Calculate which date/field combos have multiple divisions playing (for highlighting)
     multi_division_fields = set()
     if highlight_multi_division:
-        for selected_date in unique_dates:
-            date_df = df[df['Game Date'] == selected_date].copy()
-            for field in all_fields:
-                # Skip empty fields (McGovern, Pershing if no games)
-                field_games = date_df[date_df['Field'] == field]
-                if len(field_games) > 0:
-                    unique_divisions = field_games['Division'].unique()
-                    if len(unique_divisions) > 1:
-                        multi_division_fields.add((selected_date, field))
-
-    # Build master data structure: list of (date, time, field_counts) for each date/time combination
-    master_data = []
-    game_details_master = {}  # Key: (date, time, field) -> list of game info
-
-    for selected_date in unique_dates:
-        date_df = df[df['Game Date'] == selected_date].copy()
-
-        if len(date_df) == 0:
-            continue
-
-        # Get unique time slots for this date
-        date_times = sorted(date_df['Time'].unique())
-
-        for time in date_times:
-            row_data = {
-                'Date': date_format_map[selected_date],  # Use short formatted date
-                'Date_Full': selected_date,  # Keep full date for lookups
-                'Time': time
-            }
-
-            # Get division names for each field at this date/time
-            for field in all_fields:
-                field_games = date_df[(date_df['Time'] == time) & (date_df['Field'] == field)]
-                game_count = len(field_games)
+        shown_dates = set(unique_dates)
+        multi_division_fields = {key for key in get_multi_division_fields(df) if key[0] in shown_dates}
 
-                if game_count > 0:
-                    # Get unique divisions for this time/field
-                    divisions = field_games['Division'].unique()
-                    row_data[field] = ', '.join(sorted(divisions))
-                else:
-                    row_data[field] = ''
-
-                # Store game details for tooltips
-                if game_count > 0:
-                    key = (selected_date, time, field)
-                    if key not in game_details_master:
-                        game_details_master[key] = []
-                    for _, game_row in field_games.iterrows():
-                        game_info = f"{game_row['Division']} - {game_row['Home']} vs {game_row['Away']}"
-                        game_details_master[key].append(game_info)
-
-            # Calculate row total (count of games across all fields)
-            row_data['Grand Total'] = sum(1 for field in all_fields if row_data[field] != '')
-
-            master_data.append(row_data)
+    # Build master data structure (cached per set of dates shown): one row per date/time combination
+    master_data, game_details_master = master_field_rows(df, unique_dates, all_fields)
 
     # Calculate Grand Total row (totals by field across entire season)
     totals_row = {'Date': 'Grand Total', 'Time': ''}
+    field_counts = df['Field'].value_counts()
     for field in all_fields:
-        totals_row[field] = df[df['Field'] == field].shape[0]
+        totals_row[field] = int(field_counts.get(field, 0))
     totals_row['Grand Total'] = len(df)
 
     master_data.append(totals_row)
 
-    # Generate HTML table with styling and tooltips
-    html = """
+    # Generate HTML table with styling and tooltips (pieces are collected and joined once)
+    html_parts = ["""
     <style>
         .master-view-table {
             border-collapse: collapse;
@@ -1078,12 +1411,12 @@ elif page == "🏟️ Master Field View":
             <tr>
                 <th>Date</th>
                 <th>Time</th>
-    """
+    """]
 
     # Add field column headers
     for field in all_fields:
-        html += f'<th class="field-column">{field}</th>'
-    html += "<th>Grand Total</th></tr></thead><tbody>"
+        html_parts.append(f'<th class="field-column">{field}</th>')
+    html_parts.append("<th>Grand Total</th></tr></thead><tbody>")
 
     # Track date changes for rowspan
     current_date = None
@@ -1102,20 +1435,20 @@ elif page == "🏟️ Master Field View":
         time = row_data['Time']
         is_total_row = date == 'Grand Total'
 
-        html += "<tr>"
+        html_parts.append("<tr>")
 
         # Date column (with rowspan)
         if date != current_date:
             if is_total_row:
-                html += f'<th class="total-row" colspan="2">Grand Total</th>'
+                html_parts.append(f'<th class="total-row" colspan="2">Grand Total</th>')
             else:
                 rowspan = date_row_count.get(date, 1)
-                html += f'<th class="date-cell" rowspan="{rowspan}">{date}</th>'
-                html += f'<th>{time}</th>'
+                html_parts.append(f'<th class="date-cell" rowspan="{rowspan}">{date}</th>')
+                html_parts.append(f'<th>{time}</th>')
             current_date = date
         else:
             if not is_total_row:
-                html += f'<th>{time}</th>'
+                html_parts.append(f'<th>{time}</th>')
 
         # Field columns
         if not is_total_row:
@@ -1133,111 +1466,71 @@ elif page == "🏟️ Master Field View":
                     cell_class = "field-column tooltip-cell"
                     if should_highlight:
                         cell_class += " multi-division-highlight"
-                    html += f'''<td class="{cell_class}">
+                    html_parts.append(f'''<td class="{cell_class}">
                         {value}
                         <span class="tooltiptext">{tooltip_content}</span>
-                    </td>'''
+                    </td>''')
                 else:
                     cell_class = "field-column"
                     if should_highlight:
                         cell_class += " multi-division-highlight"
-                    html += f'<td class="{cell_class}">{value}</td>'
+                    html_parts.append(f'<td class="{cell_class}">{value}</td>')
 
             # Grand Total column
-            html += f'<td class="total-column">{row_data["Grand Total"]}</td>'
+            html_parts.append(f'<td class="total-column">{row_data["Grand Total"]}</td>')
         else:
             # Grand Total row
             for field in all_fields:
                 value = row_data[field]
-                html += f'<td class="field-column total-row">{value}</td>'
-            html += f'<td class="total-cell">{row_data["Grand Total"]}</td>'
+                html_parts.append(f'<td class="field-column total-row">{value}</td>')
+            html_parts.append(f'<td class="total-cell">{row_data["Grand Total"]}</td>')
 
-        html += "</tr>"
+        html_parts.append("</tr>")
 
-    html += "</tbody></table>"
+    html_parts.append("</tbody></table>")
 
     # Display tip above table
     st.markdown("💡 **Tip:** Mouse over a cell for game info.")
 
-    st.markdown(html, unsafe_allow_html=True)
+    st.markdown("".join(html_parts), unsafe_allow_html=True)
 
 elif page == "👥 Team Schedules":
     st.title("👥 Team Schedules")
     
-    # Create a dictionary mapping teams to their divisions
-    team_division_map = {}
-    for _, row in df.iterrows():
-        home_team = row['Home']
-        away_team = row['Away']
-        division = row['Division']
-        
-        if pd.notna(home_team) and home_team not in team_division_map:
-            team_division_map[home_team] = division
-        if pd.notna(away_team) and away_team not in team_division_map:
-            team_division_map[away_team] = division
-    
-    # Create team options with division prefix and sort
-    team_options = []
-    for team, division in team_division_map.items():
-        team_options.append({
-            'display': f"{division} - {team}",
-            'team': team,
-            'division': division
-        })
-    
-    # Sort by division (convert to number for proper sorting), then by team name
-    def sort_key(item):
-        # Extract numeric part from division (e.g., "10U" -> 10)
-        div = item['division']
-        try:
-            num = int(''.join(filter(str.isdigit, div)))
-        except:
-            num = 999  # Put non-numeric divisions at the end
-        return (num, item['team'])
-    
-    team_options.sort(key=sort_key)
-    
-    # Create display list and lookup
-    team_display_list = [opt['display'] for opt in team_options]
-    team_lookup = {opt['display']: opt['team'] for opt in team_options}
+    # "Division - Team" labels sorted by division number, then team name
+    team_lookup = get_team_options(df)
     
     # Team selector
-    selected_display = st.selectbox("Team", team_display_list)
+    selected_display = st.selectbox("Team", list(team_lookup))
     selected_team = team_lookup[selected_display]
     
-    # Filter games for this team
-    team_games = df[
-        (df['Home'] == selected_team) | 
-        (df['Away'] == selected_team)
-    ].copy()
+    # Filter games for this team (a view is enough, no columns are added)
+    _, home_idx, away_idx = get_team_index(df)
+    team_games = df.iloc[team_game_rows(home_idx, away_idx, [selected_team])]
     
-    # Add Home/Away indicator
-    team_games['Home/Away'] = team_games.apply(
-        lambda row: 'Home' if row['Home'] == selected_team else 'Away',
-        axis=1
-    )
+    # Home/Away split straight from the precomputed Home rows
+    home_games = len(home_idx.get(selected_team, []))
+    away_games = len(team_games) - home_games
     
     # Display metrics
     col1, col2, col3 = st.columns(3)
     with col1:
         st.metric("Total Games", len(team_games))
     with col2:
-        home_games = len(team_games[team_games['Home/Away'] == 'Home'])
         st.metric("Home Games", home_games)
     with col3:
-        away_games = len(team_games[team_games['Home/Away'] == 'Away'])
         st.metric("Away Games", away_games)
     
     # Display schedule (drop the parsed date column)
     display_cols = ['Week', 'Game Date', 'Time', 'Field', 'Home', 'Away']
-    st.dataframe(
+    show_dataframe(
         team_games[display_cols],
         use_container_width=True,
         hide_index=True
     )
     
     # Download button
-    csv = team_games[display_cols].to_csv(index=False)
+    csv = to_csv_bytes(team_games[display_cols])
     st.download_button(
         "📥 Download as CSV",
         csv,
@@ -1251,75 +1544,31 @@ elif page == "📋 Team vs Date Matrix":
     # Division filter
     selected_division = st.selectbox(
         "Division", 
-        sort_divisions(df['Division'].unique())
+        filter_options.divisions
     )
     
     # Filter by division
-    division_df = df[df['Division'] == selected_division].copy()
+    division_df = df.iloc[division_rows(df)[selected_division]]
     
-    # Get all teams for this division
-    home_teams = division_df['Home'].dropna().unique()
-    away_teams = division_df['Away'].dropna().unique()
-    all_teams = sorted(set(list(home_teams) + list(away_teams)))
+    # All dates this division plays on
+    division_dates = list(division_df['Game Date'].cat.remove_unused_categories().cat.categories)
     
-    # Create date format mapping (Mon-11/3, Tue-12/1, etc.)
-    date_headers = {}
-    for date_str in sorted(division_df['Game Date'].unique()):
-        # Parse the date
-        date_obj = pd.to_datetime(date_str)
-        # Get day of week abbreviation and format as Mon-11/3
-        day_abbr = date_obj.strftime('%a')  # Mon, Tue, Wed, etc.
-        month_day = date_obj.strftime('%-m/%-d')  # Month/Day without leading zeros
-        short_date = f"{day_abbr}-{month_day}"
-        date_headers[date_str] = short_date
-    
-    # Create a list to hold team game counts per date
-    matrix_data = []
-    
-    for team in all_teams:
-        team_row = {'Team': team}
-        
-        # For each unique date, count games
-        for date in sorted(division_df['Game Date'].unique()):
-            games_on_date = division_df[
-                ((division_df['Home'] == team) | (division_df['Away'] == team)) &
-                (division_df['Game Date'] == date)
-            ]
-            count = len(games_on_date)
-            # Use the short date format as column name
-            team_row[date_headers[date]] = count if count > 0 else None
-        
-        # Add total games column
-        team_total = len(division_df[
-            (division_df['Home'] == team) | (division_df['Away'] == team)
-        ])
-        team_row['Total Games'] = team_total
-        
-        matrix_data.append(team_row)
-    
-    # Convert to DataFrame
-    matrix_df = pd.DataFrame(matrix_data)
-    
-    # Calculate totals row (games per date)
-    totals_row = {'Team': 'Grand Total'}
-    for date in sorted(division_df['Game Date'].unique()):
-        short_date = date_headers[date]
-        games_on_date = len(division_df[division_df['Game Date'] == date])
-        totals_row[short_date] = games_on_date
-    totals_row['Total Games'] = len(division_df)
-    
-    # Append totals row
-    matrix_df = pd.concat([matrix_df, pd.DataFrame([totals_row])], ignore_index=True)
-    
-    # Set Team as index
-    matrix_df = matrix_df.set_index('Team')
-    
-    # Replace None with empty string for display, convert numbers to int
-    for col in matrix_df.columns:
-        matrix_df[col] = matrix_df[col].apply(lambda x: int(x) if pd.notna(x) and x != '' else '')
+    # Create date format mapping (Mon-11/3, Tue-12/1, etc.), formatting all dates in one call
+    date_headers = dict(zip(division_dates, pd.to_datetime(pd.Index(division_dates)).strftime('%a-%-m/%-d')))
+    
+    # Count games per team per date in a single pass over the Home/Away codes
+    matrix_df = team_date_counts(division_df, get_division_teams(df, selected_division), division_dates)
+    matrix_df['Total Games'] = matrix_df.sum(axis=1)
     
-    # Generate HTML table with styling
-    html = """
+    # Add totals row (games per date)
+    date_totals = division_df.groupby('Game Date', observed=True).size().reindex(division_dates, fill_value=0)
+    matrix_df.loc['Grand Total'] = list(date_totals) + [len(division_df)]
+    
+    # Use the short date format as column names (counts stay numeric, zeros are blanked when rendered)
+    matrix_df = matrix_df.rename(columns=date_headers).rename_axis(columns=None).astype('int16')
+    
+    # Generate HTML table with styling (pieces are collected and joined once)
+    html_parts = ["""
     <style>
         .matrix-table {
             border-collapse: collapse;
@@ -1356,22 +1605,22 @@ elif page == "📋 Team vs Date Matrix":
         <thead>
             <tr>
                 <th>Team</th>
-    """
+    """]
     
     # Add column headers (dates)
     date_columns = [col for col in matrix_df.columns if col != 'Total Games']
     for date_col in date_columns:
-        html += f"<th>{date_col}</th>"
-    html += "<th>Total Games</th></tr></thead><tbody>"
+        html_parts.append(f"<th>{date_col}</th>")
+    html_parts.append("<th>Total Games</th></tr></thead><tbody>")
     
     # Add data rows
-    for team_name in matrix_df.index:
+    for team_name, row in matrix_df.to_dict('index').items():
         is_total_row = team_name == 'Grand Total'
-        html += "<tr>"
+        html_parts.append("<tr>")
         
         # Team name column
         cell_class = 'total-row' if is_total_row else ''
-        html += f'<th class="{cell_class}">{team_name}</th>'
+        html_parts.append(f'<th class="{cell_class}">{team_name}</th>')
         
         # Date columns
         for date_col in date_columns:
@@ -1379,25 +1628,26 @@ elif page == "📋 Team vs Date Matrix":
                 cell_class = 'total-row'
             else:
                 cell_class = ''
-            value = matrix_df.loc[team_name, date_col]
-            display_value = value if value != '' else ''
-            html += f'<td class="{cell_class}">{display_value}</td>'
+            value = row[date_col]
+            display_value = value if value != 0 else ''
+            html_parts.append(f'<td class="{cell_class}">{display_value}</td>')
         
         # Total Games column (highlighted differently based on row)
         if is_total_row:
             cell_class = 'total-cell'
         else:
             cell_class = 'total-column'
-        total_value = matrix_df.loc[team_name, 'Total Games']
-        html += f'<td class="{cell_class}">{total_value}</td>'
-        html += "</tr>"
+        total_value = row['Total Games']
+        html_parts.append(f'<td class="{cell_class}">{total_value}</td>')
+        html_parts.append("</tr>")
     
-    html += "</tbody></table>"
+    html_parts.append("</tbody></table>")
     
-    st.markdown(html, unsafe_allow_html=True)
+    st.markdown("".join(html_parts), unsafe_allow_html=True)
     
     # Download button
-    csv = matrix_df.to_csv()
+    # Zero counts export as blank cells
+    csv = to_csv_bytes(matrix_df.astype('Int16').mask(matrix_df.eq(0)), index=True)
     st.download_button(
         "📥 Download as CSV",
         csv,
@@ -1411,76 +1661,24 @@ elif page == "📊 Division Summary":
     # Division filter
     selected_division = st.selectbox(
         "Division", 
-        sort_divisions(df['Division'].unique())
+        filter_options.divisions
     )
     
     # Filter games for selected division
-    div_df = df[df['Division'] == selected_division].copy()
-    
-    # Get all teams in this division
-    home_teams = div_df['Home'].dropna().unique()
-    away_teams = div_df['Away'].dropna().unique()
-    all_teams = sorted(set(list(home_teams) + list(away_teams)))
+    div_df = df.iloc[division_rows(df)[selected_division]]
     
-    # Create summary data for selected division only
-    summary_rows = []
+    # Team x week game counts with totals (cached per division)
+    summary_df = division_week_summary(df, selected_division)
     
-    # Track division totals per week
-    division_week_totals = {}
-    division_grand_total = 0
+    # Calculate date ranges for each week for tooltips (first/last game date per week in one groupby)
+    week_bounds = div_df.groupby('Week')['Game Date Parsed'].agg(['min', 'max'])
+    week_date_ranges = dict(zip(
+        week_bounds.index,
+        week_bounds['min'].dt.strftime('%-m/%-d') + '-' + week_bounds['max'].dt.strftime('%-m/%-d')
+    ))
     
-    # Add row for each team (no division header row)
-    for team in all_teams:
-        team_row = {
-            'Team': team
-        }
-        
-        team_total = 0
-        
-        # Count games per week for this team
-        for week in sorted(df['Week'].unique()):
-            week_games = div_df[
-                ((div_df['Home'] == team) | (div_df['Away'] == team)) &
-                (div_df['Week'] == week)
-            ]
-            count = len(week_games)
-            team_row[f'Week {week}'] = count if count > 0 else ''
-            team_total += count
-            
-            # Track for division totals
-            if week not in division_week_totals:
-                division_week_totals[week] = 0
-            division_week_totals[week] += count
-        
-        team_row['Grand Total'] = team_total
-        division_grand_total += team_total
-        summary_rows.append(team_row)
-    
-    # Add division total row
-    division_total_row = {
-        'Team': f'{selected_division} Total'
-    }
-    for week in sorted(df['Week'].unique()):
-        division_total_row[f'Week {week}'] = division_week_totals.get(week, '')
-    division_total_row['Grand Total'] = division_grand_total
-    summary_rows.append(division_total_row)
-    
-    # Convert to DataFrame
-    summary_df = pd.DataFrame(summary_rows)
-    
-    # Calculate date ranges for each week for tooltips
-    week_date_ranges = {}
-    for week in sorted(df['Week'].unique()):
-        week_games = div_df[div_df['Week'] == week]
-        if len(week_games) > 0:
-            # Parse dates and get min/max
-            dates = pd.to_datetime(week_games['Game Date'])
-            min_date = dates.min().strftime('%-m/%-d')
-            max_date = dates.max().strftime('%-m/%-d')
-            week_date_ranges[week] = f"{min_date}-{max_date}"
-    
-    # Create styled HTML table
-    html = """
+    # Create styled HTML table (pieces are collected and joined once)
+    html_parts = ["""
     <style>
         .summary-table {
             border-collapse: collapse;
@@ -1558,7 +1756,7 @@ elif page == "📊 Division Summary":
     <table class="summary-table">
         <thead>
             <tr>
-    """
+    """]
     
     # Add headers with tooltips for Week columns
     for col in summary_df.columns:
@@ -1567,18 +1765,18 @@ elif page == "📊 Division Summary":
             week_num = int(col.split(' ')[1])
             if week_num in week_date_ranges:
                 date_range = week_date_ranges[week_num]
-                html += f'''<th class="tooltip-header">{col}<span class="tooltiptext">{date_range}</span></th>'''
+                html_parts.append(f'''<th class="tooltip-header">{col}<span class="tooltiptext">{date_range}</span></th>''')
             else:
-                html += f"<th>{col}</th>"
+                html_parts.append(f"<th>{col}</th>")
         else:
-            html += f"<th>{col}</th>"
-    html += "</tr></thead><tbody>"
+            html_parts.append(f"<th>{col}</th>")
+    html_parts.append("</tr></thead><tbody>")
     
     # Add data rows
-    for idx, row in summary_df.iterrows():
+    for row in summary_df.to_dict('records'):
         is_total_row = 'Total' in str(row.get('Team', ''))
         row_class = 'total-row' if is_total_row else ''
-        html += f'<tr class="{row_class}">'
+        html_parts.append(f'<tr class="{row_class}">')
         
         for col_idx, col in enumerate(summary_df.columns):
             value = row[col]
@@ -1592,17 +1790,17 @@ elif page == "📊 Division Summary":
             else:
                 cell_class = ''
             
-            html += f'<td class="{cell_class}">{value}</td>'
+            html_parts.append(f'<td class="{cell_class}">{value}</td>')
         
-        html += "</tr>"
+        html_parts.append("</tr>")
     
-    html += "</tbody></table>"
+    html_parts.append("</tbody></table>")
     
     # Display the styled table
-    st.markdown(html, unsafe_allow_html=True)
+    st.markdown("".join(html_parts), unsafe_allow_html=True)
     
     # Download button
-    csv = summary_df.to_csv(index=False)
+    csv = to_csv_bytes(summary_df)
     st.download_button(
         "📥 Download as CSV",
         csv,
@@ -1618,32 +1816,12 @@ elif page == "✏️ Edit Game*":
     
     col1, col2, col3 = st.columns(3)
     with col1:
-        # Get all unique teams from both Home and Away columns
-        all_teams = set(df['Home'].dropna().tolist() + df['Away'].dropna().tolist())
-        
-        # Create team options with "Division - Team Name" format
-        team_division_map = {}
-        for team in all_teams:
-            # Find the division for this team (check both Home and Away)
-            team_games = df[(df['Home'] == team) | (df['Away'] == team)]
-            if len(team_games) > 0:
-                division = team_games.iloc[0]['Division']
-                team_division_map[team] = division
-        
-        # Create formatted team list: "Division - Team Name"
-        team_list = [f"{team_division_map[team]} - {team}" for team in all_teams if team in team_division_map]
-        
-        # Sort by division (numerically) then by team name
-        def sort_key(team_str):
-            division, team_name = team_str.split(" - ", 1)
-            # Extract numeric part from division (e.g., "10U" -> 10)
-            try:
-                div_num = int(''.join(filter(str.isdigit, division)))
-            except:
-                div_num = 999
-            return (div_num, team_name)
-        
-        team_options = ["All"] + sorted(team_list, key=sort_key)
+        # Row positions of each team's Home and Away games
+        _, home_idx, away_idx = get_team_index(df)
+        
+        # "Division - Team Name" options sorted by division number, then team name
+        team_lookup = get_team_options(df)
+        team_options = ["All"] + list(team_lookup)
         
         search_team = st.selectbox("Team", team_options)
     with col2:
@@ -1661,32 +1839,26 @@ elif page == "✏️ Edit Game*":
             help="Filter games on or before this date"
         )
     
-    # Filter games
-    search_df = df.copy()
+    # Filter games (every step returns a new frame, so the cached df is never modified)
+    search_df = df
     
     # Apply team filter
     if search_team != "All":
-        # Extract just the team name from "Division - Team Name"
-        selected_team = search_team.split(" - ", 1)[1] if " - " in search_team else search_team
-        search_df = search_df[(search_df['Home'] == selected_team) | (search_df['Away'] == selected_team)]
+        # Look up just the team name from "Division - Team Name"
+        selected_team = team_lookup[search_team]
+        search_df = search_df.iloc[team_game_rows(home_idx, away_idx, [selected_team])]
     
-    # Apply date filters if provided
+    # Apply date filters if provided (Game Date is parsed once when the data is loaded)
     if start_date is not None:
-        search_df['Date_Parsed'] = pd.to_datetime(search_df['Game Date'])
-        search_df = search_df[search_df['Date_Parsed'].dt.date >= start_date]
+        search_df = search_df[search_df['Game Date Parsed'] >= pd.Timestamp(start_date)]
     
     if end_date is not None:
-        if 'Date_Parsed' not in search_df.columns:
-            search_df['Date_Parsed'] = pd.to_datetime(search_df['Game Date'])
-        search_df = search_df[search_df['Date_Parsed'].dt.date <= end_date]
-    
-    # Create game selection options
-    game_options = []
-    game_indices = []
-    for idx, row in search_df.iterrows():
-        game_display = f"Game #{row['Game #']} | {row['Game Date']} {row['Time']} | {row['Division']} | {row['Home']} vs {row['Away']} @ {row['Field']}"
-        game_options.append(game_display)
-        game_indices.append(idx)
+        search_df = search_df[search_df['Game Date Parsed'] < pd.Timestamp(end_date) + pd.Timedelta(days=1)]
+    
+    # Create game selection options from the labels formatted once for the whole schedule
+    game_options = get_game_labels(df).loc[search_df.index].tolist()
+    game_indices = search_df.index.tolist()
+    display_to_idx = dict(zip(game_options, game_indices))
     
     if len(game_options) == 0:
         st.info("No games found with selected filters")
@@ -1696,16 +1868,10 @@ elif page == "✏️ Edit Game*":
             # Find the game in the current search results
             saved_game_num = st.session_state.saved_game_number
             
-            # Try to find this game in current results
-            matching_games = search_df[search_df['Game #'] == saved_game_num]
-            if len(matching_games) > 0:
-                # Find index in game_options
-                for i, idx in enumerate(game_indices):
-                    if df.loc[idx]['Game #'] == saved_game_num:
-                        default_index = i
-                        break
-                else:
-                    default_index = 0
+            # Try to find this game's position in current results
+            matching_positions = np.flatnonzero(search_df['Game #'].to_numpy() == saved_game_num)
+            if len(matching_positions) > 0:
+                default_index = int(matching_positions[0])
             else:
                 default_index = 0
             
@@ -1719,13 +1885,13 @@ elif page == "✏️ Edit Game*":
         # Display filtered games count after dropdown
         st.markdown(f"*Found {len(search_df)} games*")
         
-        selected_idx = game_indices[game_options.index(selected_game_display)]
+        selected_idx = display_to_idx[selected_game_display]
         
         # Reload game data from database to get latest values (in case it was just edited)
-        conn = sqlite3.connect('wusa_schedule.db')
+        conn = get_conn()
         game_num = int(df.loc[selected_idx]['Game #'])
-        current_game_df = pd.read_sql(f"SELECT * FROM games WHERE \"Game #\" = {game_num}", conn)
-        conn.close()
+        columns = ', '.join(f'"{col}"' for col in GAMES_COLUMNS)
+        current_game_df = pd.read_sql_query(f"SELECT {columns} FROM games WHERE \"Game #\" = ?", conn, params=(game_num,))
         
         if len(current_game_df) > 0:
             selected_game = current_game_df.iloc[0]
@@ -1739,12 +1905,12 @@ elif page == "✏️ Edit Game*":
         st.markdown("*💡 Tips: Week and Daycode are automatically recalculated based on the Game Date you select. All changes to this game will be tracked in the change history below.*")
         
         # Get all unique values for dropdowns
-        all_fields = sorted(df['Field'].unique())
-        all_times = sorted(df['Time'].unique())
-        all_home_teams = sorted(df['Home'].dropna().unique())
-        all_away_teams = sorted(df['Away'].dropna().unique())
-        all_statuses = sorted(df['Status'].dropna().unique())
-        all_dates = sorted(df['Game Date'].unique())
+        all_fields = filter_options.fields
+        all_times = filter_options.times
+        all_home_teams = filter_options.home_teams
+        all_away_teams = filter_options.away_teams
+        all_statuses = filter_options.statuses
+        all_dates = filter_options.dates
         
         # Create form with dropdowns where possible
         with st.form("edit_game_form"):
@@ -1922,7 +2088,7 @@ elif page == "✏️ Edit Game*":
                     changes_for_email.append(("Daycode (auto-calculated)", selected_game['Daycode'], new_daycode))
                 
                 # Get existing audit trail
-                conn = sqlite3.connect('wusa_schedule.db')
+                conn = get_conn()
                 cursor = conn.cursor()
                 
                 cursor.execute("SELECT game_audit_trail FROM games WHERE \"Game #\" = ?", (game_num,))
@@ -1964,24 +2130,23 @@ elif page == "✏️ Edit Game*":
                         WHERE "Game #" = ?
                     """
                     
-                    cursor.execute(update_query, (
-                        new_game_date,
-                        new_field,
-                        new_time,
-                        new_home,
-                        new_away,
-                        new_status,
-                        new_week,
-                        new_daycode,
-                        new_comment,
-                        new_original_date,
-                        new_audit_trail,
-                        current_timestamp,
-                        game_num  # Use converted int
-                    ))
-                    
-                    conn.commit()
-                    conn.close()
+                    # Commits on success and rolls back if the update raises
+                    with get_write_lock(), conn:
+                        conn.execute(update_query, (
+                            new_game_date,
+                            new_field,
+                            new_time,
+                            new_home,
+                            new_away,
+                            new_status,
+                            new_week,
+                            new_daycode,
+                            new_comment,
+                            new_original_date,
+                            new_audit_trail,
+                            current_timestamp,
+                            game_num  # Use converted int
+                        ))
 
                     # Send admin notification email if there were changes
                     if changes_for_email:
@@ -2006,8 +2171,10 @@ elif page == "✏️ Edit Game*":
                     else:
                         success_msg = "✅ No changes were made."
 
-                    # Clear cache to reload data
-                    st.cache_data.clear()
+                    # Reload the games frame (an edit can move a game to a new date, field or
+                    # time, which changes the category levels) and the Recent Changes list
+                    load_games.clear()
+                    load_edited_games.clear()
 
                     # Store success message in session state
                     st.session_state.edit_success_message = success_msg
@@ -2019,7 +2186,6 @@ elif page == "✏️ Edit Game*":
                     st.rerun()
                         
                 except Exception as e:
-                    conn.close()
                     st.error(f"❌ Error updating game: {str(e)}")
                     st.error(f"Debug info: Game # = {game_num}")
         
@@ -2037,13 +2203,12 @@ elif page == "✏️ Edit Game*":
         st.markdown("### 📜 Selected Game's Change History")
         
         # Always get fresh data from database (not cached) to show latest changes
-        conn = sqlite3.connect('wusa_schedule.db')
+        conn = get_conn()
         # Use a direct query without caching
         cursor = conn.cursor()
         game_num = int(selected_game['Game #'])
         cursor.execute("SELECT game_audit_trail FROM games WHERE \"Game #\" = ?", (game_num,))
         result = cursor.fetchone()
-        conn.close()
         
         if result and result[0]:
             audit_trail = result[0]
@@ -2092,66 +2257,14 @@ elif page == "📅 Teams by Day":
     # Division filter
     selected_division = st.selectbox(
         "Division", 
-        sort_divisions(df['Division'].unique())
+        filter_options.divisions
     )
     
-    # Filter games for selected division
-    div_df = df[df['Division'] == selected_division].copy()
-    
-    # Get all unique dates sorted
-    all_dates = sorted(div_df['Game Date'].unique())
-    
-    # Create date format mapping (M-11/3, T-12/1, etc.) with day name in header
-    date_headers = {}
-    for date_str in all_dates:
-        # Parse the date
-        date_obj = pd.to_datetime(date_str)
-        # Get day of week abbreviation and format as Mon-11/3, Tue-12/1, etc.
-        day_abbr = date_obj.strftime('%a')  # Mon, Tue, Wed, etc.
-        month_day = date_obj.strftime('%-m/%-d')  # Month/Day without leading zeros
-        short_date = f"{day_abbr}-{month_day}"
-        date_headers[date_str] = short_date
-    
-    # Get all teams in this division
-    home_teams = div_df['Home'].dropna().unique()
-    away_teams = div_df['Away'].dropna().unique()
-    all_teams = sorted(set(list(home_teams) + list(away_teams)))
-    
-    # Create matrix data
-    matrix_rows = []
-    
-    # Add row for each team
-    for team in all_teams:
-        team_row = {'Team': team}
-        team_total = 0
-        dates_with_multiple_games = 0
-        
-        # Count games per date for this team
-        for date in all_dates:
-            games_on_date = div_df[
-                ((div_df['Home'] == team) | (div_df['Away'] == team)) &
-                (div_df['Game Date'] == date)
-            ]
-            count = len(games_on_date)
-            
-            if count > 1:
-                dates_with_multiple_games += 1
-            
-            team_row[date_headers[date]] = count if count > 0 else ''
-            team_total += count
-        
-        team_row['Dates with >1 Game'] = dates_with_multiple_games if dates_with_multiple_games > 0 else ''
-        team_row['Grand Total'] = team_total
-        matrix_rows.append(team_row)
-    
-    # Convert to DataFrame
-    matrix_df = pd.DataFrame(matrix_rows)
-    
-    # Replace empty strings with None, then fillna for display
-    matrix_df = matrix_df.replace('', None).fillna('')
+    # Team x date game counts with totals (cached per division)
+    matrix_df = teams_by_day_matrix(df, selected_division)
     
-    # Generate HTML table with styling
-    html = """
+    # Generate HTML table with styling (pieces are collected and joined once)
+    html_parts = ["""
     <style>
         .teams-by-day-table {
             border-collapse: collapse;
@@ -2182,16 +2295,16 @@ elif page == "📅 Teams by Day":
     <table class="teams-by-day-table">
         <thead>
             <tr>
-    """
+    """]
     
     # Add column headers
     for col in matrix_df.columns:
-        html += f"<th>{col}</th>"
-    html += "</tr></thead><tbody>"
+        html_parts.append(f"<th>{col}</th>")
+    html_parts.append("</tr></thead><tbody>")
     
     # Add data rows
-    for idx, row in matrix_df.iterrows():
-        html += "<tr>"
+    for row in matrix_df.to_dict('records'):
+        html_parts.append("<tr>")
         
         for col in matrix_df.columns:
             value = row[col]
@@ -2200,21 +2313,21 @@ elif page == "📅 Teams by Day":
             # Apply total column styling to Grand Total column
             if col == 'Grand Total':
                 cell_tag = 'td' if col != 'Team' else 'td'
-                html += f'<{cell_tag} class="total-column">{display_value}</{cell_tag}>'
+                html_parts.append(f'<{cell_tag} class="total-column">{display_value}</{cell_tag}>')
             else:
                 if col == 'Team':
-                    html += f'<td>{display_value}</td>'
+                    html_parts.append(f'<td>{display_value}</td>')
                 else:
-                    html += f'<td>{display_value}</td>'
+                    html_parts.append(f'<td>{display_value}</td>')
         
-        html += "</tr>"
+        html_parts.append("</tr>")
     
-    html += "</tbody></table>"
+    html_parts.append("</tbody></table>")
     
-    st.markdown(html, unsafe_allow_html=True)
+    st.markdown("".join(html_parts), unsafe_allow_html=True)
     
     # Download button
-    csv = matrix_df.to_csv(index=False)
+    csv = to_csv_bytes(matrix_df)
     st.download_button(
         "📥 Download as CSV",
         csv,
@@ -2229,11 +2342,11 @@ elif page == "📆 Monthly Calendar":
     from calendar import monthrange
     
     # Get all dates and count games per date
-    df['Date_Parsed'] = pd.to_datetime(df['Game Date'])
-    date_counts = df.groupby(df['Date_Parsed'].dt.date).size().to_dict()
+    day_games = day_rows(df)
+    date_counts = {day: len(rows) for day, rows in day_games.items()}
     
     # Get available months
-    available_months = sorted(df['Date_Parsed'].dt.to_period('M').unique())
+    available_months = sorted(get_schedule_dates(df)['Game Date Parsed'].dt.to_period('M').unique())
     month_options = [f"{period.strftime('%B %Y')}" for period in available_months]
     
     # Determine default month - current month if it has games, otherwise earliest month
@@ -2374,7 +2487,7 @@ elif page == "📆 Monthly Calendar":
                 st.markdown(f"### Games on {pd.Timestamp(selected_date).strftime('%A, %B %d, %Y')}")
                 
                 # Filter games for selected date
-                date_games = df[df['Date_Parsed'].dt.date == selected_date].copy()
+                date_games = df.iloc[day_games[selected_date]]
                 
                 # Display games without Game # column
                 display_cols = ['Division', 'Time', 'Field', 'Home', 'Away']
@@ -2460,10 +2573,13 @@ elif page == "🔍 Data Query Tool*":
                 st.error("❌ Query must start with SELECT or PRAGMA. Only read-only queries are allowed.")
             else:
                 try:
-                    # Execute the query
-                    conn = sqlite3.connect('wusa_schedule.db')
-                    result_df = pd.read_sql(query, conn)
-                    conn.close()
+                    # Execute the query on its own read-only connection, so a PRAGMA can't
+                    # change settings on the shared connection the rest of the app writes with
+                    query_conn = sqlite3.connect('file:wusa_schedule.db?mode=ro', uri=True)
+                    try:
+                        result_df = pd.read_sql(query, query_conn)
+                    finally:
+                        query_conn.close()
                     
                     # Display results
                     st.success(f"✅ Query executed successfully! Found {len(result_df)} rows.")
@@ -2476,7 +2592,7 @@ elif page == "🔍 Data Query Tool*":
                     )
                     
                     # Download button
-                    csv = result_df.to_csv(index=False)
+                    csv = to_csv_bytes(result_df)
                     st.download_button(
                         "📥 Download Results as CSV",
                         csv,
@@ -2494,91 +2610,79 @@ elif page == "🔍 Data Query Tool*":
 elif page == "📝 Recent Changes*":
     st.title("📝 Recent Changes")
     
-    # Get games that have been edited (last_updated > 0)
-    conn = sqlite3.connect('wusa_schedule.db')
-    
-    # Check if last_updated column exists
-    cursor = conn.cursor()
-    cursor.execute("PRAGMA table_info(games)")
-    columns = [column[1] for column in cursor.fetchall()]
+    # Get games that have been edited (audit columns are checked for on every rerun)
+    edited_games_df = load_edited_games()
     
-    if 'last_updated' not in columns:
-        st.info("No changes tracked yet. The change tracking system will start working after the next game edit.")
-        conn.close()
+    if len(edited_games_df) == 0:
+        st.info("No games have been edited yet.")
     else:
-        # Load games with audit trails
-        edited_games_df = pd.read_sql("""
-            SELECT * FROM games 
-            WHERE game_audit_trail IS NOT NULL AND game_audit_trail != ''
-            ORDER BY last_updated DESC
-        """, conn)
-        conn.close()
-        
-        if len(edited_games_df) == 0:
-            st.info("No games have been edited yet.")
+        # Parse all audit entries from all games
+        import json
+        all_changes = []
+        
+        # Game context for each edited game, built with vectorized string concatenation
+        game_text = text_columns(edited_games_df[['Division', 'Game Date', 'Time', 'Home', 'Away']])
+        game_displays = (
+            game_text['Division'] + " - " + game_text['Game Date'] + " - " + game_text['Time'] +
+            " - " + game_text['Home'] + " vs " + game_text['Away']
+        )
+        
+        for game_display, audit_trail in zip(game_displays, edited_games_df['game_audit_trail']):
+            if audit_trail and str(audit_trail).strip():
+                audit_lines = str(audit_trail).strip().split('\n')
+                
+                for line in audit_lines:
+                    if line.strip():
+                        try:
+                            entry = json.loads(line)
+                            
+                            # Add game context to each change
+                            all_changes.append({
+                                'Last Updated': entry['timestamp'],
+                                'Game': game_display,
+                                'Field Changed': entry['field'],
+                                'Old Value': entry['old_value'],
+                                'New Value': entry['new_value']
+                            })
+                        except:
+                            pass
+        
+        if len(all_changes) == 0:
+            st.info("No detailed change history available.")
         else:
-            # Parse all audit entries from all games
-            import json
-            all_changes = []
+            # Convert to DataFrame
+            changes_df = pd.DataFrame(all_changes)
             
-            for _, game in edited_games_df.iterrows():
-                audit_trail = game['game_audit_trail']
-                
-                if audit_trail and str(audit_trail).strip():
-                    audit_lines = str(audit_trail).strip().split('\n')
-                    
-                    for line in audit_lines:
-                        if line.strip():
-                            try:
-                                entry = json.loads(line)
-                                # Add game context to each change
-                                game_display = f"{game['Division']} - {game['Game Date']} - {game['Time']} - {game['Home']} vs {game['Away']}"
-                                
-                                all_changes.append({
-                                    'Last Updated': entry['timestamp'],
-                                    'Game': game_display,
-                                    'Field Changed': entry['field'],
-                                    'Old Value': entry['old_value'],
-                                    'New Value': entry['new_value']
-                                })
-                            except:
-                                pass
+            # Convert timestamp string to datetime for proper sorting
+            # (audit entries are always written by add_audit_entry in this format)
+            changes_df['timestamp_dt'] = pd.to_datetime(changes_df['Last Updated'], format='%Y-%m-%d %H:%M:%S')
             
-            if len(all_changes) == 0:
-                st.info("No detailed change history available.")
-            else:
-                # Convert to DataFrame
-                changes_df = pd.DataFrame(all_changes)
-                
-                # Convert timestamp string to datetime for proper sorting
-                changes_df['timestamp_dt'] = pd.to_datetime(changes_df['Last Updated'])
-                
-                # Sort by datetime descending (most recent first)
-                changes_df = changes_df.sort_values('timestamp_dt', ascending=False).reset_index(drop=True)
-                
-                # Format timestamp for display in user's locale
-                # Use DatetimeColumn which automatically displays in user's browser timezone
-                
-                st.markdown(f"*Showing {len(all_changes)} changes across {len(edited_games_df)} games*")
-                
-                # Display the table
-                st.dataframe(
-                    changes_df[['timestamp_dt', 'Game', 'Field Changed', 'Old Value', 'New Value']],
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        'timestamp_dt': st.column_config.DatetimeColumn(
-                            'Last Updated',
-                            format="YYYY-MM-DD HH:mm:ss",
-                            timezone='local'
-                        ),
-                        'Game': st.column_config.TextColumn('Game', width='large'),
-                        'Field Changed': st.column_config.TextColumn('Field Changed', width='medium'),
-                        'Old Value': st.column_config.TextColumn('Old Value', width='medium'),
-                        'New Value': st.column_config.TextColumn('New Value', width='medium')
-                    },
-                    height=600
-                )
+            # Sort by datetime descending (most recent first)
+            changes_df = changes_df.sort_values('timestamp_dt', ascending=False).reset_index(drop=True)
+            
+            # Format timestamp for display in user's locale
+            # Use DatetimeColumn which automatically displays in user's browser timezone
+            
+            st.markdown(f"*Showing {len(all_changes)} changes across {len(edited_games_df)} games*")
+            
+            # Display the table (paged once the history gets long)
+            show_dataframe(
+                changes_df[['timestamp_dt', 'Game', 'Field Changed', 'Old Value', 'New Value']],
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    'timestamp_dt': st.column_config.DatetimeColumn(
+                        'Last Updated',
+                        format="YYYY-MM-DD HH:mm:ss",
+                        timezone='local'
+                    ),
+                    'Game': st.column_config.TextColumn('Game', width='large'),
+                    'Field Changed': st.column_config.TextColumn('Field Changed', width='medium'),
+                    'Old Value': st.column_config.TextColumn('Old Value', width='medium'),
+                    'New Value': st.column_config.TextColumn('New Value', width='medium')
+                },
+                height=600
+            )
 
 elif page == "⚙️ Settings*":
     st.title("⚙️ Settings")
@@ -2677,10 +2781,12 @@ elif page == "⚙️ Settings*":
                 for error in errors:
                     st.error(f"❌ {error}")
             else:
-                # Save settings (strip any trailing/leading whitespace)
-                set_setting('email_from_address', from_address.strip())
-                set_setting('email_to_addresses', to_addresses.strip())
-                set_setting('admin_password', admin_password.strip())
+                # Save settings in one transaction (strip any trailing/leading whitespace)
+                set_settings({
+                    'email_from_address': from_address.strip(),
+                    'email_to_addresses': to_addresses.strip(),
+                    'admin_password': admin_password.strip()
+                })
 
                 # Store success message in session state
                 st.session_state.settings_success_message = "✅ Settings saved successfully!"